@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+AI Insights Cache Warmer for PlanWise
+Recomputes destination insights for upcoming vacations before users ask for them:
+- Priority queue ordered by start date and cache expiry
+- Rate-limited batches to keep background CPU bounded
+- Identical (normalized) requests are analyzed once and shared
+"""
+
+import argparse
+import heapq
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from vacation_destination_analyzer import DEFAULT_CATALOG, DestinationCatalog, VacationDestinationAnalyzer
+
+RequestKey = Tuple[str, str, Optional[str]]
+
+
+def normalize_request(vacation: Dict) -> RequestKey:
+    """
+    Build the dedup key for a vacation's insights request
+
+    Args:
+        vacation: Feed entry with startDate, endDate and optional destination
+
+    Returns:
+        (start date, end date, destination) with dates as YYYY-MM-DD
+    """
+    start = datetime.strptime(vacation["startDate"][:10], "%Y-%m-%d").strftime("%Y-%m-%d")
+    end = datetime.strptime(vacation["endDate"][:10], "%Y-%m-%d").strftime("%Y-%m-%d")
+    destination = (vacation.get("destination") or "").strip() or None
+    return start, end, destination
+
+
+def normalize_expiry(expires_at: Optional[str]) -> str:
+    """
+    Normalize a cache expiry timestamp
+
+    Args:
+        expires_at: ISO timestamp from the cached insights (optional)
+
+    Returns:
+        Expiry date as YYYY-MM-DD, or "" when nothing is cached
+    """
+    if not expires_at:
+        return ""
+    if not isinstance(expires_at, str):
+        raise TypeError(f"cacheExpiresAt must be an ISO date string, got {expires_at!r}")
+    return datetime.strptime(expires_at[:10], "%Y-%m-%d").strftime("%Y-%m-%d")
+
+
+class InsightsWarmer:
+    def __init__(self, sink: Callable[[Dict, Dict], None], catalog: DestinationCatalog = None,
+                 batch_size: int = 10, min_interval: float = 1.0):
+        """
+        Initialize the warmer
+
+        Args:
+            sink: Called with (vacation, insights payload) for every warmed vacation
+            catalog: Team catalog overlay (optional, defaults to the shared base catalog)
+            batch_size: Maximum number of analyses per batch
+            min_interval: Minimum seconds between the start of two batches
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        if min_interval < 0:
+            raise ValueError(f"min_interval must not be negative, got {min_interval}")
+
+        self.sink = sink
+        self.analyzer = VacationDestinationAnalyzer(catalog if catalog is not None else DEFAULT_CATALOG)
+        self.batch_size = batch_size
+        self.min_interval = min_interval
+
+        self._queue = []        # heap of (start date, cache expiry, sequence, request key)
+        self._priority = {}     # request key -> best queued priority
+        self._waiting = {}      # request key -> {vacation id: vacation}
+        self._scheduled = {}    # vacation id -> request key
+        self._sequence = 0
+        self._last_batch = None
+
+    def __len__(self) -> int:
+        return len(self._waiting)
+
+    def schedule(self, vacations: List[Dict], now: datetime = None) -> int:
+        """
+        Add upcoming vacations to the queue
+
+        Vacations without an ID, that already started, or whose cached insights
+        last through the end of the trip are skipped. Rescheduling a vacation ID
+        replaces its previous request (e.g. after an edit).
+
+        Args:
+            vacations: Feed entries (vacationId or _id, startDate, endDate, destination,
+                       vacationName, cacheExpiresAt - the last three optional)
+            now: Current time (defaults to datetime.now())
+
+        Returns:
+            Number of newly queued vacations (rescheduled IDs are not counted again)
+        """
+        now = now or datetime.now()
+        today = now.strftime("%Y-%m-%d")
+        queued = 0
+
+        for vacation in vacations:
+            vacation_id = (vacation.get("vacationId") or vacation.get("_id")) if isinstance(vacation, dict) else None
+            if not isinstance(vacation_id, str):
+                # Results without a string ID can't be cached by the Node side
+                print(f"Skipping vacation without ID: {vacation}", file=sys.stderr)
+                continue
+
+            try:
+                key = normalize_request(vacation)
+                expiry = normalize_expiry(vacation.get("cacheExpiresAt"))
+            except (KeyError, TypeError, ValueError) as e:
+                print(f"Skipping invalid vacation {vacation_id}: {e}", file=sys.stderr)
+                continue
+
+            start, end, _ = key
+            if start < today or (expiry and expiry > end):
+                continue
+
+            if vacation_id not in self._scheduled:
+                queued += 1
+            self._unschedule(vacation_id)
+            self._waiting.setdefault(key, {})[vacation_id] = vacation
+            self._scheduled[vacation_id] = key
+
+            # Missing cache entries sort before cached ones starting the same day
+            priority = (start, expiry)
+            if key not in self._priority or priority < self._priority[key]:
+                self._priority[key] = priority
+                self._sequence += 1
+                heapq.heappush(self._queue, (start, expiry, self._sequence, key))
+
+        return queued
+
+    def run_batch(self) -> int:
+        """
+        Warm the most urgent requests, waiting first if the rate limit requires it
+
+        Returns:
+            Number of vacations warmed
+        """
+        if self._last_batch is not None:
+            wait = self.min_interval - (time.monotonic() - self._last_batch)
+            if wait > 0:
+                time.sleep(wait)
+        self._last_batch = time.monotonic()
+
+        warmed = 0
+        analyses = 0
+        while self._queue and analyses < self.batch_size:
+            start, expiry, _, key = heapq.heappop(self._queue)
+            # Skip stale heap entries left behind by reprioritized or emptied requests
+            if self._priority.get(key) != (start, expiry):
+                continue
+            del self._priority[key]
+            vacations = self._waiting.pop(key, {})
+            if not vacations:
+                continue
+
+            # One analysis per normalized request, shared by every vacation waiting on it
+            analysis = self.analyzer.analyze_vacation_timing(*key)
+            analyses += 1
+
+            for vacation_id, vacation in vacations.items():
+                del self._scheduled[vacation_id]
+                if "error" in analysis:
+                    print(f"Skipping vacation {vacation_id}: {analysis['error']}", file=sys.stderr)
+                    continue
+                self.sink(vacation, self._build_payload(vacation, key, analysis))
+                warmed += 1
+
+        return warmed
+
+    def run(self, max_batches: int = None) -> int:
+        """
+        Drain the queue in rate-limited batches
+
+        Args:
+            max_batches: Stop after this many batches (optional)
+
+        Returns:
+            Total number of vacations warmed
+        """
+        warmed = 0
+        batches = 0
+        while self._waiting and (max_batches is None or batches < max_batches):
+            warmed += self.run_batch()
+            batches += 1
+        return warmed
+
+    def _unschedule(self, vacation_id: str):
+        """Drop a vacation's pending request; emptied requests are skipped lazily"""
+        key = self._scheduled.pop(vacation_id, None)
+        if key is None:
+            return
+        group = self._waiting.get(key)
+        if group is not None:
+            group.pop(vacation_id, None)
+            if not group:
+                del self._waiting[key]
+                self._priority.pop(key, None)
+
+    @staticmethod
+    def _build_payload(vacation: Dict, key: RequestKey, analysis: Dict) -> Dict:
+        """Format insights the same way the /api/vacation-insights endpoint caches them"""
+        start, end, destination = key
+        return {
+            "vacation_info": {
+                "name": vacation.get("vacationName") or "Your Vacation",
+                "start_date": start,
+                "end_date": end,
+                "destination": destination
+            },
+            "ai_analysis": analysis,
+            "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
+            "from_cache": False
+        }
+
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def non_negative_float(value: str) -> float:
+    """argparse type for durations that must not be negative"""
+    number = float(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative, got {number}")
+    return number
+
+
+def main():
+    """Command line interface for the cache warmer"""
+    parser = argparse.ArgumentParser(description="Precompute AI insights for upcoming vacations")
+    parser.add_argument("--feed", help="JSON file with upcoming vacations (defaults to stdin)")
+    parser.add_argument("--batch-size", type=positive_int, default=10, help="Analyses per batch")
+    parser.add_argument("--interval", type=non_negative_float, default=1.0, help="Minimum seconds between batches")
+    parser.add_argument("--max-batches", type=positive_int, help="Stop after this many batches (optional)")
+    parser.add_argument("--catalog-overlay", help="JSON file with team catalog overrides (optional)")
+
+    args = parser.parse_args()
+
+    if args.feed:
+        with open(args.feed) as f:
+            vacations = json.load(f)
+    else:
+        vacations = json.load(sys.stdin)
+
+    catalog = DEFAULT_CATALOG
+    if args.catalog_overlay:
+        with open(args.catalog_overlay) as f:
+            overlay = json.load(f)
+        catalog = DEFAULT_CATALOG.overlay(overlay.get("categories"), overlay.get("boosts"))
+
+    def emit(vacation: Dict, payload: Dict):
+        # One JSON line per vacation, ready for cacheInsights(vacationId, endDate, insights)
+        print(json.dumps({
+            "vacationId": vacation.get("vacationId") or vacation.get("_id"),
+            "endDate": payload["vacation_info"]["end_date"],
+            "insights": payload
+        }), flush=True)
+
+    warmer = InsightsWarmer(emit, catalog, batch_size=args.batch_size, min_interval=args.interval)
+    queued = warmer.schedule(vacations)
+    warmed = warmer.run(args.max_batches)
+    print(f"Warmed {warmed} of {queued} queued vacations", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
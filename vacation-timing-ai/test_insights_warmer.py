@@ -0,0 +1,124 @@
+"""Tests for the priority-scheduled insights cache warmer"""
+
+from datetime import datetime
+
+import pytest
+
+from insights_warmer import InsightsWarmer, normalize_request
+
+NOW = datetime(2026, 10, 19, 9, 0)
+
+
+def vacation(vacation_id, start, end, **extra):
+    return {"vacationId": vacation_id, "startDate": start, "endDate": end, **extra}
+
+
+@pytest.fixture
+def warmed():
+    return []
+
+
+@pytest.fixture
+def warmer(warmed):
+    return InsightsWarmer(lambda v, payload: warmed.append((v.get("vacationId") or v["_id"], payload)), min_interval=0)
+
+
+def test_normalize_request_trims_dates_and_destination():
+    assert normalize_request(vacation("a", "2026-12-01T00:00:00.000Z", "2026-12-05", destination=" Goa (IN) ")) == \
+        ("2026-12-01", "2026-12-05", "Goa (IN)")
+    assert normalize_request(vacation("a", "2026-12-01", "2026-12-05", destination="  ")) == \
+        ("2026-12-01", "2026-12-05", None)
+
+
+def test_warms_in_start_date_then_expiry_order(warmer, warmed):
+    warmer.schedule([
+        vacation("late", "2027-01-10", "2027-01-12"),
+        vacation("cached", "2026-11-01", "2026-11-03", destination="Agra (IN)", cacheExpiresAt="2026-11-02T10:00:00Z"),
+        vacation("uncached", "2026-11-01", "2026-11-03"),
+    ], now=NOW)
+
+    assert warmer.run() == 3
+    assert [vacation_id for vacation_id, _ in warmed] == ["uncached", "cached", "late"]
+
+
+def test_identical_requests_are_analyzed_once(warmer, warmed, monkeypatch):
+    calls = []
+    analyze = warmer.analyzer.analyze_vacation_timing
+    monkeypatch.setattr(warmer.analyzer, "analyze_vacation_timing", lambda *args: calls.append(args) or analyze(*args))
+
+    warmer.schedule([
+        vacation("a", "2026-12-01", "2026-12-05", destination="Goa (IN)", vacationName="Winter"),
+        vacation("b", "2026-12-01T00:00:00.000Z", "2026-12-05", destination=" Goa (IN) "),
+    ], now=NOW)
+
+    assert len(warmer) == 1
+    assert warmer.run() == 2
+    assert calls == [("2026-12-01", "2026-12-05", "Goa (IN)")]
+    payloads = dict(warmed)
+    assert payloads["a"]["ai_analysis"] is payloads["b"]["ai_analysis"]
+    assert payloads["a"]["vacation_info"]["name"] == "Winter"
+    assert payloads["b"]["vacation_info"]["name"] == "Your Vacation"
+    assert payloads["a"]["from_cache"] is False
+
+
+def test_reschedule_moves_vacation_to_new_request(warmer, warmed):
+    assert warmer.schedule([vacation("x", "2027-03-01", "2027-03-02"), vacation("y", "2027-02-01", "2027-02-02")], now=NOW) == 2
+    # Editing y to a later trip leaves a stale heap entry for its old dates
+    assert warmer.schedule([vacation("y", "2027-04-01", "2027-04-02")], now=NOW) == 0
+    assert len(warmer) == 2
+
+    assert warmer.run() == 2
+    assert [(v, p["vacation_info"]["start_date"]) for v, p in warmed] == [("x", "2027-03-01"), ("y", "2027-04-01")]
+    assert not warmer._queue
+
+
+def test_reschedule_to_earlier_date_reprioritizes(warmer, warmed):
+    warmer.schedule([vacation("x", "2027-03-01", "2027-03-02"), vacation("y", "2027-05-01", "2027-05-02")], now=NOW)
+    warmer.schedule([vacation("z", "2027-05-01", "2027-05-02", cacheExpiresAt="2027-01-01")], now=NOW)
+    # An uncached duplicate of an already queued request moves it up
+    warmer.schedule([vacation("w", "2027-05-01", "2027-05-02")], now=NOW)
+
+    warmer.run()
+    assert [v for v, _ in warmed] == ["x", "y", "z", "w"]
+
+
+def test_skip_rules(warmer, warmed, capsys):
+    queued = warmer.schedule([
+        vacation("past", "2026-10-01", "2026-10-05"),
+        vacation("cached-through-end", "2026-11-01", "2026-11-03", cacheExpiresAt="2026-11-04T00:00:00Z"),
+        vacation("bad-date", "soon", "2026-11-03"),
+        vacation("bad-expiry", "2026-11-01", "2026-11-03", cacheExpiresAt=1798000000000),
+        {"_id": {"$oid": "abc"}, "startDate": "2026-11-01", "endDate": "2026-11-03"},
+        {"startDate": "2026-11-01", "endDate": "2026-11-03"},
+        "not-a-vacation",
+        {"_id": "mongo-id", "startDate": "2026-10-19", "endDate": "2026-10-20"},
+    ], now=NOW)
+
+    assert queued == 1
+    assert warmer.run() == 1
+    assert [v for v, _ in warmed] == ["mongo-id"]
+    err = capsys.readouterr().err
+    assert "Skipping invalid vacation bad-date" in err
+    assert "Skipping invalid vacation bad-expiry" in err
+    assert err.count("Skipping vacation without ID") == 3
+
+
+def test_batches_are_limited_and_rate_limited(warmed, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("insights_warmer.time.sleep", sleeps.append)
+    warmer = InsightsWarmer(lambda v, payload: warmed.append(v["vacationId"]), batch_size=2, min_interval=5)
+    warmer.schedule([vacation(str(i), f"2026-12-0{i}", f"2026-12-0{i}") for i in range(1, 6)], now=NOW)
+
+    assert warmer.run_batch() == 2
+    assert warmer.run(max_batches=1) == 2
+    assert warmed == ["1", "2", "3", "4"]
+    assert len(sleeps) == 1 and 0 < sleeps[0] <= 5
+
+    assert warmer.run() == 1
+    assert len(warmer) == 0
+
+
+@pytest.mark.parametrize("kwargs", [{"batch_size": 0}, {"batch_size": -1}, {"min_interval": -1}])
+def test_invalid_limits_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        InsightsWarmer(lambda v, payload: None, **kwargs)
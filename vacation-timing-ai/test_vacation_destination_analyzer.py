@@ -0,0 +1,169 @@
+"""Tests for the layered destination catalog and the analyzer built on it"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from vacation_destination_analyzer import (
+    DEFAULT_CATALOG,
+    DEFAULT_DESTINATIONS,
+    VacationDestinationAnalyzer,
+)
+
+DOMESTIC = {
+    "destinations": ["NYC (US)", "Atlanta (US)"],
+    "best_months": [4, 5, 6, 9, 10],
+    "climate": "temperate",
+    "duration_fit": {"short": 9, "medium": 9, "long": 8}
+}
+
+
+class BaselineAnalyzer(VacationDestinationAnalyzer):
+    """Scoring as it was before the catalog refactor, reading the plain dict"""
+
+    def _get_destination_recommendations(self, month, duration, season_info, current_destination=None):
+        recommendations = []
+        current_category = None
+        if current_destination:
+            for category, data in DEFAULT_DESTINATIONS.items():
+                if current_destination in data["destinations"]:
+                    current_category = category
+                    break
+
+        for category, data in DEFAULT_DESTINATIONS.items():
+            month_score = 10 if month in data["best_months"] else 5
+            duration_score = data["duration_fit"][duration]
+            total_score = (month_score + duration_score) / 2
+            category_boost = 5 if current_category and category == current_category else 0
+            if category in season_info["ideal_for"]:
+                total_score += 1
+            available_destinations = [d for d in data["destinations"] if d != current_destination]
+            for dest in available_destinations[:2]:
+                recommendations.append({
+                    "destination": dest,
+                    "category": category.replace("_", " ").title(),
+                    "score": total_score + category_boost,
+                    "reasoning": self._get_recommendation_reasoning(category, month, duration),
+                    "climate": data["climate"],
+                    "same_category": category == current_category
+                })
+
+        recommendations.sort(key=lambda x: x["score"], reverse=True)
+        return recommendations[:3]
+
+    def _analyze_current_choice(self, destination, month, duration):
+        for category, data in DEFAULT_DESTINATIONS.items():
+            if destination in data["destinations"]:
+                month_score = 10 if month in data["best_months"] else 3
+                total_score = (month_score + data["duration_fit"][duration]) / 2
+                if total_score >= 8:
+                    verdict = "Excellent choice!"
+                elif total_score >= 6:
+                    verdict = "Good choice, but consider alternatives"
+                else:
+                    verdict = "Consider other destinations for better experience"
+                return {
+                    "destination": destination,
+                    "category": category.replace("_", " ").title(),
+                    "score": total_score,
+                    "verdict": verdict,
+                    "analysis": self._get_choice_analysis(category, month, duration)
+                }
+        return {
+            "destination": destination,
+            "analysis": "Unknown destination",
+            "score": 5,
+            "recommendation": "Consider researching seasonal weather patterns"
+        }
+
+
+@pytest.mark.parametrize("month", range(1, 13))
+def test_default_catalog_matches_baseline(month):
+    analyzer = VacationDestinationAnalyzer()
+    baseline = BaselineAnalyzer()
+    destinations = [None, "Unknown Place"] + [d for data in DEFAULT_DESTINATIONS.values() for d in data["destinations"]]
+
+    start = date(2026, month, 10)
+    for days in (2, 7, 14):
+        end = start + timedelta(days=days)
+        for destination in destinations:
+            args = (start.isoformat(), end.isoformat(), destination)
+            assert analyzer.analyze_vacation_timing(*args) == baseline.analyze_vacation_timing(*args)
+
+
+def test_overlay_shares_untouched_categories():
+    overlay = DEFAULT_CATALOG.overlay({"beaches": {"best_months": [6]}})
+
+    assert overlay["hill_stations"] is DEFAULT_CATALOG["hill_stations"]
+    assert overlay.score_table("hill_stations") is DEFAULT_CATALOG.score_table("hill_stations")
+    assert overlay.score_table("beaches") is not DEFAULT_CATALOG.score_table("beaches")
+    assert overlay._destination_index() is DEFAULT_CATALOG._destination_index()
+    assert list(overlay) == list(DEFAULT_CATALOG)
+    assert overlay["beaches"]["best_months"] == [6]
+    assert DEFAULT_CATALOG["beaches"]["best_months"] == DEFAULT_DESTINATIONS["beaches"]["best_months"]
+
+
+def test_overlay_moves_destination_to_new_category():
+    overlay = DEFAULT_CATALOG.overlay(
+        {"international": {"remove_destinations": ["NYC (US)", "Atlanta (US)"]}, "domestic": DOMESTIC},
+        {"domestic": 2}
+    )
+
+    assert list(overlay) == list(DEFAULT_CATALOG) + ["domestic"]
+    assert overlay.category_of("NYC (US)") == "domestic"
+    assert "NYC (US)" not in overlay["international"]["destinations"]
+    assert DEFAULT_CATALOG.category_of("NYC (US)") == "international"
+    assert overlay.boost("domestic") == 2
+    assert overlay._destination_index() is not DEFAULT_CATALOG._destination_index()
+
+    result = VacationDestinationAnalyzer(overlay).analyze_vacation_timing("2026-05-01", "2026-05-04", "NYC (US)")
+    assert result["destination_recommendations"][0]["destination"] == "Atlanta (US)"
+    assert result["current_destination_analysis"]["category"] == "Domestic"
+
+
+def test_overlay_add_destinations_and_drop_category():
+    overlay = DEFAULT_CATALOG.overlay({"beaches": {"add_destinations": ["Gokarna (IN)", "Goa (IN)"]}})
+    assert overlay["beaches"]["destinations"] == DEFAULT_DESTINATIONS["beaches"]["destinations"] + ["Gokarna (IN)"]
+    assert overlay.category_of("Gokarna (IN)") == "beaches"
+
+    dropped = overlay.overlay({"desert_heritage": None}, {"adventure": 1})
+    assert "desert_heritage" not in dropped
+    assert list(dropped) == ["hill_stations", "beaches", "adventure", "international"]
+    assert dropped.category_of("Agra (IN)") is None
+    assert dropped.category_of("Gokarna (IN)") == "beaches"
+    assert dropped.score_table("beaches") is overlay.score_table("beaches")
+    with pytest.raises(KeyError):
+        dropped["desert_heritage"]
+
+
+def test_boosts_inherit_through_layers():
+    team = DEFAULT_CATALOG.overlay(boosts={"beaches": 1.5})
+    office = team.overlay(boosts={"adventure": 1})
+
+    assert office.boost("beaches") == 1.5
+    assert office.boost("adventure") == 1
+    assert office.boost("hill_stations") == 0
+    assert DEFAULT_CATALOG.boost("beaches") == 0
+
+
+@pytest.mark.parametrize("categories, boosts, message", [
+    ({"beaches": {"best_month": [6]}}, None, "unknown fields"),
+    ({"beaches": "oops"}, None, "must be an object"),
+    ({"beaches": {"best_months": 5}}, None, "best_months"),
+    ({"beaches": {"best_months": [0, 13]}}, None, "best_months"),
+    ({"beaches": {"duration_fit": {"short": "a", "medium": 1, "long": 1}}}, None, "duration_fit"),
+    ({"beaches": {"duration_fit": {"short": 1}}}, None, "missing duration_fit"),
+    ({"beaches": {"climate": 3}}, None, "climate"),
+    ({"beaches": {"remove_destinations": "Goa (IN)"}}, None, "remove_destinations"),
+    ({"x": dict(DOMESTIC, destinations="abc")}, None, "destinations"),
+    ({"x": {"destinations": ["X"]}}, None, "missing fields"),
+    (None, {"beaches": "2"}, "finite number"),
+    (None, {"beaches": True}, "finite number"),
+    (None, {"beaches": float("nan")}, "finite number"),
+    (None, {"beaches": float("inf")}, "finite number"),
+    (None, {"nope": 1}, "unknown category"),
+    ({"beaches": None}, {"beaches": 1}, "unknown category"),
+])
+def test_invalid_overlays_are_rejected(categories, boosts, message):
+    with pytest.raises(ValueError, match=message):
+        DEFAULT_CATALOG.overlay(categories, boosts)
@@ -10,54 +10,265 @@ Analyzes vacation dates and recommends optimal destinations based on:
 
 import argparse
 import json
+import math
 import sys
+from collections.abc import Mapping
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_DESTINATIONS = {
+    # Hill Stations - Best for Summer (Apr-Jun)
+    "hill_stations": {
+        "destinations": ["Srinagar (IN)", "Manali (IN)", "Shimla (IN)", "Dehradun (IN)", "Coorg (IN)", "Munnar (IN)"],
+        "best_months": [4, 5, 6, 7, 8, 9],  # Apr-Sep
+        "climate": "cool",
+        "duration_fit": {"short": 8, "medium": 9, "long": 10}
+    },
+    
+    # Beaches - Best for Winter (Oct-Mar) 
+    "beaches": {
+        "destinations": ["Goa (IN)", "Kerala (IN)", "Andaman (IN)", "Puducherry (IN)"],
+        "best_months": [10, 11, 12, 1, 2, 3],  # Oct-Mar
+        "climate": "tropical",
+        "duration_fit": {"short": 9, "medium": 10, "long": 9}
+    },
+    
+    # Desert/Heritage - Best for Winter (Nov-Feb)
+    "desert_heritage": {
+        "destinations": ["Agra (IN)", "Delhi (IN)", "Jaipur (IN)"],
+        "best_months": [11, 12, 1, 2],  # Nov-Feb
+        "climate": "arid",
+        "duration_fit": {"short": 7, "medium": 9, "long": 8}
+    },
+    
+    # Adventure/Trekking - Best for specific seasons
+    "adventure": {
+        "destinations": ["Leh Ladakh (IN)", "Spiti Valley (IN)"],
+        "best_months": [5, 6, 7, 8, 9],  # May-Sep
+        "climate": "mountain",
+        "duration_fit": {"short": 6, "medium": 8, "long": 10}
+    },
+    
+    # International - Year-round with seasonal preferences
+    "international": {
+        "destinations": ["Singapore", "Dubai", "Bangkok (TH)", "NYC (US)", "Toronto (CA)", "Atlanta (US)", "London (UK)"],
+        "best_months": [1, 2, 3, 4, 5, 10, 11, 12],  # Avoid monsoon
+        "climate": "varied",
+        "duration_fit": {"short": 7, "medium": 9, "long": 10}
+    }
+}
+
+DURATION_CATEGORIES = ("short", "medium", "long")
+REQUIRED_CATEGORY_FIELDS = ("destinations", "best_months", "climate", "duration_fit")
+DESTINATION_EDIT_FIELDS = ("add_destinations", "remove_destinations")
+
+
+class DestinationCatalog(Mapping):
+    """
+    Layered destination catalog with copy-on-write overlays
+
+    The base layer holds the full category data. An overlay only stores the
+    categories it changes and resolves them lazily against its parent; untouched
+    categories, their score tables and the destination lookup are shared with
+    the parent instead of being copied. Resolved category data is shared
+    between layers, so treat it as read-only.
+
+    Overlay category values:
+        None: remove the category
+        dict: fields replacing the parent's ("destinations", "best_months",
+              "climate", "duration_fit"), plus "add_destinations" and
+              "remove_destinations" for small list edits. Categories that do
+              not exist in the parent must provide every field.
+    """
+
+    def __init__(self, categories: Dict = None, boosts: Dict = None, parent: "DestinationCatalog" = None):
+        self._parent = parent
+        self._overrides = dict(categories or {})
+        self._boosts = dict(boosts or {})
+        self._resolved = {}
+        self._score_tables = {}
+        self._index = None
+        self._order = None
+
+        # Resolve eagerly only to validate the overlay; results are cached
+        for category in self._overrides:
+            self._resolve(category)
+
+        for category, boost in self._boosts.items():
+            if not _is_number(boost):
+                raise ValueError(f"Boost for category '{category}' must be a finite number, got {boost!r}")
+            if category not in self:
+                raise ValueError(f"Boost for unknown category '{category}'")
+
+    def overlay(self, categories: Dict = None, boosts: Dict = None) -> "DestinationCatalog":
+        """Create a team overlay on top of this catalog"""
+        return DestinationCatalog(categories, boosts, parent=self)
+
+    def __getitem__(self, category: str) -> Dict:
+        data = self._resolve(category)
+        if data is None:
+            raise KeyError(category)
+        return data
+
+    def __iter__(self):
+        return iter(self._category_order())
+
+    def __len__(self) -> int:
+        return len(self._category_order())
+
+    def boost(self, category: str) -> float:
+        """Extra recommendation score for a category (inherited from parent layers)"""
+        if category in self._boosts:
+            return self._boosts[category]
+        return self._parent.boost(category) if self._parent else 0
+
+    def category_of(self, destination: str) -> Optional[str]:
+        """Find the category a destination belongs to (first match wins)"""
+        return self._destination_index().get(destination)
+
+    def score_table(self, category: str) -> Dict[Tuple[int, str], Tuple[float, float]]:
+        """
+        Precomputed scores for a category
+
+        Returns:
+            Mapping of (month, duration category) to
+            (recommendation score, current choice score)
+        """
+        if category not in self._overrides and self._parent is not None:
+            return self._parent.score_table(category)
+
+        table = self._score_tables.get(category)
+        if table is None:
+            data = self[category]
+            best_months = set(data["best_months"])
+            table = {}
+            for month in range(1, 13):
+                in_season = month in best_months
+                for duration in DURATION_CATEGORIES:
+                    duration_score = data["duration_fit"][duration]
+                    table[(month, duration)] = (
+                        ((10 if in_season else 5) + duration_score) / 2,
+                        ((10 if in_season else 3) + duration_score) / 2
+                    )
+            self._score_tables[category] = table
+        return table
+
+    def _resolve(self, category: str) -> Optional[Dict]:
+        """Resolve a category through the layers, copying only on write"""
+        if category in self._resolved:
+            return self._resolved[category]
+
+        if category not in self._overrides:
+            return self._parent._resolve(category) if self._parent else None
+
+        override = self._overrides[category]
+        if override is None:
+            data = None
+        else:
+            base = self._parent._resolve(category) if self._parent else None
+            data = self._merge(category, base, override)
+
+        self._resolved[category] = data
+        return data
+
+    @staticmethod
+    def _merge(category: str, base: Optional[Dict], override: Dict) -> Dict:
+        """Apply an overlay patch on top of the parent's category data"""
+        if not isinstance(override, dict):
+            raise ValueError(f"Category '{category}' must be an object or null, got {override!r}")
+        unknown = [field for field in override if field not in REQUIRED_CATEGORY_FIELDS + DESTINATION_EDIT_FIELDS]
+        if unknown:
+            raise ValueError(f"Category '{category}' has unknown fields: {', '.join(unknown)}")
+
+        for field in ("destinations",) + DESTINATION_EDIT_FIELDS:
+            if field in override and not (isinstance(override[field], list)
+                                          and all(isinstance(d, str) for d in override[field])):
+                raise ValueError(f"Category '{category}' {field} must be a list of strings")
+        if "best_months" in override and not (
+                isinstance(override["best_months"], list)
+                and all(isinstance(m, int) and not isinstance(m, bool) and 1 <= m <= 12
+                        for m in override["best_months"])):
+            raise ValueError(f"Category '{category}' best_months must be a list of months (1-12)")
+        if "climate" in override and not isinstance(override["climate"], str):
+            raise ValueError(f"Category '{category}' climate must be a string")
+        if "duration_fit" in override and not (
+                isinstance(override["duration_fit"], dict)
+                and all(_is_number(v) for v in override["duration_fit"].values())):
+            raise ValueError(f"Category '{category}' duration_fit scores must be numbers")
+
+        data = dict(base or {})
+        data.update({k: v for k, v in override.items() if k not in DESTINATION_EDIT_FIELDS})
+
+        removed = set(override.get("remove_destinations", []))
+        added = override.get("add_destinations", [])
+        if removed or added:
+            destinations = [d for d in data.get("destinations", []) if d not in removed]
+            destinations += [d for d in added if d not in destinations]
+            data["destinations"] = destinations
+
+        missing = [field for field in REQUIRED_CATEGORY_FIELDS if field not in data]
+        if missing:
+            raise ValueError(f"Category '{category}' is missing fields: {', '.join(missing)}")
+        missing = [d for d in DURATION_CATEGORIES if d not in data["duration_fit"]]
+        if missing:
+            raise ValueError(f"Category '{category}' is missing duration_fit for: {', '.join(missing)}")
+
+        return data
+
+    def _category_order(self) -> List[str]:
+        """Parent categories in their original order, then new ones from this layer"""
+        if self._order is None:
+            if self._parent is not None and not self._overrides:
+                return self._parent._category_order()
+            order = []
+            if self._parent is not None:
+                order = [c for c in self._parent._category_order()
+                         if c not in self._overrides or self._overrides[c] is not None]
+            order += [c for c, v in self._overrides.items() if v is not None and c not in order]
+            self._order = order
+        return self._order
+
+    def _destination_index(self) -> Dict[str, str]:
+        """Destination -> category lookup, shared with the parent when no list changed"""
+        if self._index is None:
+            touches_destinations = any(
+                override is None
+                or "destinations" in override
+                or "add_destinations" in override
+                or "remove_destinations" in override
+                or (self._parent is not None and self._parent._resolve(category) is None)
+                for category, override in self._overrides.items()
+            )
+            if self._parent is not None and not touches_destinations:
+                return self._parent._destination_index()
+
+            index = {}
+            for category in self._category_order():
+                for destination in self[category]["destinations"]:
+                    index.setdefault(destination, category)
+            self._index = index
+        return self._index
+
+
+def _is_number(value) -> bool:
+    """True for finite ints/floats (bools excluded)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+# Shared base catalog used by every analyzer without a team overlay
+DEFAULT_CATALOG = DestinationCatalog(DEFAULT_DESTINATIONS)
+
 
 class VacationDestinationAnalyzer:
-    def __init__(self):
-        """Initialize the analyzer with destination and seasonal data"""
-        self.destinations = {
-            # Hill Stations - Best for Summer (Apr-Jun)
-            "hill_stations": {
-                "destinations": ["Srinagar (IN)", "Manali (IN)", "Shimla (IN)", "Dehradun (IN)", "Coorg (IN)", "Munnar (IN)"],
-                "best_months": [4, 5, 6, 7, 8, 9],  # Apr-Sep
-                "climate": "cool",
-                "duration_fit": {"short": 8, "medium": 9, "long": 10}
-            },
-            
-            # Beaches - Best for Winter (Oct-Mar) 
-            "beaches": {
-                "destinations": ["Goa (IN)", "Kerala (IN)", "Andaman (IN)", "Puducherry (IN)"],
-                "best_months": [10, 11, 12, 1, 2, 3],  # Oct-Mar
-                "climate": "tropical",
-                "duration_fit": {"short": 9, "medium": 10, "long": 9}
-            },
-            
-            # Desert/Heritage - Best for Winter (Nov-Feb)
-            "desert_heritage": {
-                "destinations": ["Agra (IN)", "Delhi (IN)", "Jaipur (IN)"],
-                "best_months": [11, 12, 1, 2],  # Nov-Feb
-                "climate": "arid",
-                "duration_fit": {"short": 7, "medium": 9, "long": 8}
-            },
-            
-            # Adventure/Trekking - Best for specific seasons
-            "adventure": {
-                "destinations": ["Leh Ladakh (IN)", "Spiti Valley (IN)"],
-                "best_months": [5, 6, 7, 8, 9],  # May-Sep
-                "climate": "mountain",
-                "duration_fit": {"short": 6, "medium": 8, "long": 10}
-            },
-            
-            # International - Year-round with seasonal preferences
-            "international": {
-                "destinations": ["Singapore", "Dubai", "Bangkok (TH)", "NYC (US)", "Toronto (CA)", "Atlanta (US)", "London (UK)"],
-                "best_months": [1, 2, 3, 4, 5, 10, 11, 12],  # Avoid monsoon
-                "climate": "varied",
-                "duration_fit": {"short": 7, "medium": 9, "long": 10}
-            }
-        }
+    def __init__(self, catalog: DestinationCatalog = None):
+        """
+        Initialize the analyzer with destination and seasonal data
+
+        Args:
+            catalog: Team catalog overlay (optional, defaults to the shared base catalog)
+        """
+        self.catalog = catalog if catalog is not None else DEFAULT_CATALOG
+        self.destinations = self.catalog
     
     def analyze_vacation_timing(self, start_date: str, end_date: str, current_destination: str = None) -> Dict:
         """
@@ -154,20 +365,13 @@ class VacationDestinationAnalyzer:
     def _get_destination_recommendations(self, month: int, duration: str, season_info: Dict, current_destination: str = None) -> List[Dict]:
         """Get ranked destination recommendations based on timing and duration"""
         recommendations = []
-        current_category = None
         
         # Find the category of current destination if provided
-        if current_destination:
-            for category, data in self.destinations.items():
-                if current_destination in data["destinations"]:
-                    current_category = category
-                    break
+        current_category = self.catalog.category_of(current_destination) if current_destination else None
         
-        for category, data in self.destinations.items():
-            # Calculate score based on month match and duration fit
-            month_score = 10 if month in data["best_months"] else 5
-            duration_score = data["duration_fit"][duration]
-            total_score = (month_score + duration_score) / 2
+        for category, data in self.catalog.items():
+            # Score based on month match and duration fit (precomputed per category)
+            total_score = self.catalog.score_table(category)[(month, duration)][0]
             
             # Boost score significantly if same category as current destination
             category_boost = 0
@@ -178,6 +382,9 @@ class VacationDestinationAnalyzer:
             if category in season_info["ideal_for"]:
                 total_score += 1  # Small boost for seasonal appropriateness
             
+            # Team-specific boost from the catalog overlay
+            total_score += self.catalog.boost(category)
+            
             # Pick top 2 destinations from category (not including current destination)
             available_destinations = [d for d in data["destinations"] if d != current_destination]
             
@@ -198,14 +405,7 @@ class VacationDestinationAnalyzer:
     def _analyze_current_choice(self, destination: str, month: int, duration: str) -> Dict:
         """Analyze user's current destination choice"""
         # Find which category the destination belongs to
-        destination_category = None
-        category_data = None
-        
-        for category, data in self.destinations.items():
-            if destination in data["destinations"]:
-                destination_category = category
-                category_data = data
-                break
+        destination_category = self.catalog.category_of(destination)
         
         if not destination_category:
             return {
@@ -216,9 +416,7 @@ class VacationDestinationAnalyzer:
             }
         
         # Calculate suitability score
-        month_score = 10 if month in category_data["best_months"] else 3
-        duration_score = category_data["duration_fit"][duration]
-        total_score = (month_score + duration_score) / 2
+        total_score = self.catalog.score_table(destination_category)[(month, duration)][1]
         
         if total_score >= 8:
             verdict = "Excellent choice!"
@@ -302,10 +500,17 @@ def main():
     parser.add_argument("--end-date", required=True, help="End date (YYYY-MM-DD)")
     parser.add_argument("--current-destination", help="Current destination choice (optional)")
     parser.add_argument("--output", choices=["json", "summary"], default="json", help="Output format")
+    parser.add_argument("--catalog-overlay", help="JSON file with team catalog overrides (optional)")
     
     args = parser.parse_args()
     
-    analyzer = VacationDestinationAnalyzer()
+    catalog = DEFAULT_CATALOG
+    if args.catalog_overlay:
+        with open(args.catalog_overlay) as f:
+            overlay = json.load(f)
+        catalog = DEFAULT_CATALOG.overlay(overlay.get("categories"), overlay.get("boosts"))
+    
+    analyzer = VacationDestinationAnalyzer(catalog)
     result = analyzer.analyze_vacation_timing(
         args.start_date, 
         args.end_date, 